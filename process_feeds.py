@@ -7,11 +7,19 @@ Supports two styles:
 """
 import os
 import sys
+import io
 import json
+import pickle
+import hashlib
+import importlib
+import functools
 import smtplib
+import string
 import subprocess
 import tempfile
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from html import escape
 from pathlib import Path
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
@@ -23,91 +31,282 @@ from latex2mathml.converter import convert as latex_to_mathml
 import re
 
 
-def convert_latex_to_mathml(text):
-    """Convert LaTeX formulas in text to MathML.
+# Per-URL feed cache used for conditional (ETag / Last-Modified) requests
+FEED_CACHE_DIR = Path.home() / '.cache' / 'aps_reporter'
 
-    Supports both inline ($...$) and display ($$...$$) formulas.
+# HTML for a single by-entry email
+_ENTRY_HTML_TEMPLATE = string.Template("""<!DOCTYPE html>
+<html lang="ja">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Helvetica Neue', Arial, sans-serif;
+            line-height: 1.6;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+            background-color: #f5f5f5;
+        }
+        .container {
+            background-color: white;
+            padding: 30px;
+            border-radius: 8px;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        h1 {
+            color: #2c3e50;
+            border-bottom: 3px solid #3498db;
+            padding-bottom: 10px;
+        }
+        .summary {
+            background-color: #f9f9f9;
+            padding: 15px;
+            border-left: 4px solid #3498db;
+            margin: 15px 0;
+            color: #555;
+        }
+        a {
+            color: #3498db;
+            text-decoration: none;
+        }
+        a:hover {
+            text-decoration: underline;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1><a href="${link}" target="_blank">${title}</a></h1>
+        <div class="summary">${summary}</div>
+        <p><a href="${link}" target="_blank">Read more →</a></p>
+    </div>
+</body>
+</html>
+""")
+
+# HTML fragment for one entry of a summary report
+_SUMMARY_ENTRY_TEMPLATE = string.Template('''
+        <div class="entry">
+            <h2><a href="${link}" target="_blank">${title}</a></h2>
+            <div class="meta">公開日: ${date}</div>
+            <div class="summary">${summary}</div>
+        </div>
+''')
+
+# Display math ($$...$$) may span lines; inline math ($...$) may not.
+# Inline math is non-empty, never contains '$', and never closes on the
+# opening '$$' of a complete display block, so display math keeps priority
+# (as in "cost $5 and $$x$$") while "$x$$y$" is still two inline formulas.
+_MATH_RE = re.compile(r'\$\$(?P<disp>.*?)\$\$|\$(?P<inl>[^\n$]+?)\$(?!\$.*?\$\$)', re.DOTALL)
+
+
+@functools.lru_cache(maxsize=4096)
+def _latex_to_mathml_cached(latex):
+    """Convert a single LaTeX snippet to MathML, memoizing the result.
+
+    Returns None if the conversion fails.
     """
-    def replace_display_math(match):
-        latex = match.group(1).strip()
-        try:
-            mathml = latex_to_mathml(latex)
-            return f'<div style="text-align: center; margin: 1em 0;">{mathml}</div>'
-        except Exception as e:
-            print(f"Warning: Failed to convert display math: {latex[:50]}... Error: {e}")
+    try:
+        return latex_to_mathml(latex)
+    except Exception as e:
+        print(f"Warning: Failed to convert math: {latex[:50]}... Error: {e}")
+        return None
+
+
+def _render_math(match):
+    """Render one $$...$$ (display) or $...$ (inline) match of _MATH_RE as HTML."""
+    if match.group('disp') is not None:
+        latex = match.group('disp').strip()
+        mathml = _latex_to_mathml_cached(latex)
+        if mathml is None:
             return f'<div style="text-align: center; margin: 1em 0;"><code>{latex}</code></div>'
+        return f'<div style="text-align: center; margin: 1em 0;">{mathml}</div>'
 
-    def replace_inline_math(match):
-        latex = match.group(1).strip()
-        try:
-            mathml = latex_to_mathml(latex)
-            return mathml
-        except Exception as e:
-            print(f"Warning: Failed to convert inline math: {latex[:50]}... Error: {e}")
-            return f'<code>{latex}</code>'
+    latex = match.group('inl').strip()
+    mathml = _latex_to_mathml_cached(latex)
+    if mathml is None:
+        return f'<code>{latex}</code>'
+    return mathml
+
+
+def prebuild_mathml_map(entries):
+    """Render every unique formula across the entries' summaries once.
 
-    # First process $$...$$ (display math)
-    text = re.sub(r'\$\$(.*?)\$\$', replace_display_math, text, flags=re.DOTALL)
+    Returns a dict mapping each raw formula (including its $ delimiters)
+    to its rendered HTML, for use with convert_latex_to_mathml.
+    """
+    mathml_map = {}
+    for entry in entries:
+        summary = entry.get('summary', entry.get('description', ''))
+        for match in _MATH_RE.finditer(summary):
+            key = match.group(0)
+            if key not in mathml_map:
+                mathml_map[key] = _render_math(match)
+    return mathml_map
 
-    # Then process $...$ (inline math)
-    text = re.sub(r'\$(.*?)\$', replace_inline_math, text)
 
-    return text
+def convert_latex_to_mathml(text, mathml_map=None):
+    """Convert LaTeX formulas in text to MathML.
+
+    Supports both inline ($...$) and display ($$...$$) formulas.
+    If mathml_map (see prebuild_mathml_map) is given, formulas found in it
+    are not converted again.
+    """
+    def replace_math(match):
+        if mathml_map is not None:
+            rendered = mathml_map.get(match.group(0))
+            if rendered is not None:
+                return rendered
+        return _render_math(match)
+
+    # Process $$...$$ (display) and $...$ (inline) math in a single scan
+    return _MATH_RE.sub(replace_math, text)
 
 
 def fetch_online_feed(url):
-    """Fetch an RSS feed from a URL."""
+    """Fetch an RSS feed from a URL.
+
+    Sends the ETag / Last-Modified of the previous fetch and reuses the
+    cached feed when the server answers 304 Not Modified.
+    """
     print(f"  Fetching online feed: {url}")
-    return feedparser.parse(url)
+
+    cache_path = FEED_CACHE_DIR / f"{hashlib.blake2b(url.encode(), digest_size=16).hexdigest()}.pickle"
+    cached = None
+    if cache_path.exists():
+        try:
+            with open(cache_path, 'rb') as f:
+                cached = pickle.load(f)
+        except Exception as e:
+            print(f"    Could not read feed cache: {e}")
+
+    feed = feedparser.parse(
+        url,
+        etag=cached['etag'] if cached else None,
+        modified=cached['modified'] if cached else None,
+        resolve_relative_uris=False,
+    )
+
+    if cached and feed.get('status') == 304:
+        print("    Not modified, using cached feed")
+        return cached['feed']
+
+    if feed.get('etag') or feed.get('modified'):
+        # bozo_exception may hold unpicklable parser state, so leave it out
+        cached_feed = feedparser.FeedParserDict(
+            {key: value for key, value in feed.items() if key != 'bozo_exception'}
+        )
+        tmp_path = None
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file first so a failed dump never leaves a
+            # truncated cache behind
+            with tempfile.NamedTemporaryFile('wb', dir=cache_path.parent, delete=False) as f:
+                tmp_path = f.name
+                pickle.dump({'etag': feed.get('etag'), 'modified': feed.get('modified'), 'feed': cached_feed}, f)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"    Could not write feed cache: {e}")
+            for path in (tmp_path, cache_path):
+                if path and os.path.exists(path):
+                    os.unlink(path)
+
+    return feed
 
 
 def fetch_local_feed(script_path):
-    """Generate RSS feed by running a local script."""
+    """Generate RSS feed by running a local script.
+
+    A spec of the form ``package.module:function`` is imported and called
+    in-process with a file object as its output path. Any other spec
+    (e.g. ``python::scripts/foo.py``) is run as a subprocess with ``-`` as
+    its output path and must write the feed XML to stdout.
+    """
+    if not script_path.startswith('python::') and ':' in script_path:
+        return fetch_local_feed_module(script_path)
+
     print(f"  Running local script: {script_path}")
 
     # Remove 'python::' prefix if present
     if script_path.startswith('python::'):
         script_path = script_path[8:]
 
-    # Create temporary file for output
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.xml', delete=False) as tmp:
-        tmp_path = tmp.name
-
     try:
-        # Run the script
+        # Run the script, capturing the generated feed from stdout
         result = subprocess.run(
-            [sys.executable, script_path, tmp_path],
+            [sys.executable, script_path, '-'],
             check=True,
-            capture_output=True,
-            text=True
+            capture_output=True
         )
-        print(f"    Script output: {result.stdout}")
 
         # Parse the generated feed
-        feed = feedparser.parse(tmp_path)
+        feed = feedparser.parse(result.stdout, resolve_relative_uris=False)
         return feed
     except subprocess.CalledProcessError as e:
         print(f"    Error running script: {e}")
-        print(f"    stderr: {e.stderr}")
-        return feedparser.FeedParserDict()
-    finally:
-        # Clean up temporary file
-        if os.path.exists(tmp_path):
-            os.unlink(tmp_path)
+        print(f"    stderr: {e.stderr.decode(errors='replace')}")
+        return feedparser.FeedParserDict(entries=[])
+
+
+def fetch_local_feed_module(script_spec):
+    """Generate RSS feed by calling a ``module:function`` spec in-process.
+
+    Avoids starting a new interpreter for every trusted local script.
+    """
+    print(f"  Running local module: {script_spec}")
+
+    module_name, func_name = script_spec.split(':', 1)
+    try:
+        func = getattr(importlib.import_module(module_name), func_name)
+        buf = io.BytesIO()
+        func(buf)
+        return feedparser.parse(buf.getvalue(), resolve_relative_uris=False)
+    except Exception as e:
+        print(f"    Error running module: {e}")
+        return feedparser.FeedParserDict(entries=[])
+
+
+def fetch_local_feed_inproc(module_name):
+    """Generate feed entries by calling a local module's collect_entries() in-process.
+
+    Skips the XML serialize/parse round-trip of fetch_local_feed; the returned
+    object mimics the parts of feedparser's result used by this script.
+    """
+    print(f"  Collecting in-process feed: {module_name}")
+
+    try:
+        module = importlib.import_module(module_name)
+        entries = module.collect_entries()
+    except Exception as e:
+        print(f"    Error collecting entries: {e}")
+        return feedparser.FeedParserDict(entries=[])
+
+    return feedparser.FeedParserDict(
+        feed=feedparser.FeedParserDict(),
+        entries=[feedparser.FeedParserDict(entry) for entry in entries],
+    )
 
 
 def filter_recent_entries(entries, days_back=1):
     """Filter entries to only include those from the last N days."""
-    cutoff_date = datetime.now() - timedelta(days=days_back)
+    # Compare everything as naive UTC
+    cutoff_date = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=days_back)
     recent_entries = []
 
     for entry in entries:
         pub_date_str = entry.get('published', entry.get('updated', ''))
         try:
-            pub_date = date_parser.parse(pub_date_str)
-            # Make timezone-naive for comparison
-            if pub_date.tzinfo:
-                pub_date = pub_date.replace(tzinfo=None)
+            # Prefer the struct_time feedparser already parsed (UTC)
+            pub_parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+            if pub_parsed:
+                pub_date = datetime(*pub_parsed[:6])
+            else:
+                pub_date = date_parser.parse(pub_date_str)
+                # Convert to naive UTC for comparison
+                if pub_date.tzinfo:
+                    pub_date = pub_date.astimezone(timezone.utc).replace(tzinfo=None)
 
             if pub_date >= cutoff_date:
                 recent_entries.append(entry)
@@ -119,8 +318,32 @@ def filter_recent_entries(entries, days_back=1):
     return recent_entries
 
 
-def send_by_entry_email(feed_name, entry, smtp_config):
-    """Send one email per entry."""
+def title_html(entry):
+    """Return the entry title ready to embed in HTML.
+
+    Titles feedparser reports as text/html are already sanitized markup and
+    are used as-is; plain-text titles are escaped.
+    """
+    title = entry.get('title', 'No title')
+    if entry.get('title_detail', {}).get('type') == 'text/html':
+        return title
+    return escape(title)
+
+
+def open_smtp_connection(smtp_config):
+    """Open an authenticated SMTP session to be shared by all outgoing emails."""
+    server = smtplib.SMTP(smtp_config['smtp_host'], smtp_config['smtp_port'])
+    try:
+        server.starttls()
+        server.login(smtp_config['smtp_user'], smtp_config['smtp_password'])
+    except Exception:
+        server.close()
+        raise
+    return server
+
+
+def send_by_entry_email(feed_name, entry, server, smtp_config):
+    """Send one email per entry over an already-connected SMTP session."""
     title = entry.get('title', 'No title')
     link = entry.get('link', '')
     summary = entry.get('summary', entry.get('description', ''))
@@ -138,66 +361,18 @@ def send_by_entry_email(feed_name, entry, smtp_config):
     text_body = f"{title}\n\n{link}\n\n{summary[:500]}..."
 
     # HTML version
-    html_body = f"""<!DOCTYPE html>
-<html lang="ja">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Helvetica Neue', Arial, sans-serif;
-            line-height: 1.6;
-            max-width: 800px;
-            margin: 0 auto;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            background-color: white;
-            padding: 30px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        h1 {{
-            color: #2c3e50;
-            border-bottom: 3px solid #3498db;
-            padding-bottom: 10px;
-        }}
-        .summary {{
-            background-color: #f9f9f9;
-            padding: 15px;
-            border-left: 4px solid #3498db;
-            margin: 15px 0;
-            color: #555;
-        }}
-        a {{
-            color: #3498db;
-            text-decoration: none;
-        }}
-        a:hover {{
-            text-decoration: underline;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1><a href="{link}" target="_blank">{title}</a></h1>
-        <div class="summary">{summary_with_mathml}</div>
-        <p><a href="{link}" target="_blank">Read more →</a></p>
-    </div>
-</body>
-</html>
-"""
+    html_body = _ENTRY_HTML_TEMPLATE.substitute(
+        title=title_html(entry),
+        link=escape(link, quote=True),
+        summary=summary_with_mathml,
+    )
 
     msg.attach(MIMEText(text_body, 'plain', 'utf-8'))
     msg.attach(MIMEText(html_body, 'html', 'utf-8'))
 
     # Send email
     try:
-        with smtplib.SMTP(smtp_config['smtp_host'], smtp_config['smtp_port']) as server:
-            server.starttls()
-            server.login(smtp_config['smtp_user'], smtp_config['smtp_password'])
-            server.send_message(msg)
+        server.send_message(msg)
         print(f"    Email sent: {title[:50]}...")
     except Exception as e:
         print(f"    Failed to send email: {e}")
@@ -268,7 +443,7 @@ def generate_summary_html(feed_name, entries):
     </style>
     """
 
-    html_content = f"""<!DOCTYPE html>
+    html_parts = [f"""<!DOCTYPE html>
 <html lang="ja">
 <head>
     <meta charset="UTF-8">
@@ -280,19 +455,20 @@ def generate_summary_html(feed_name, entries):
     <div class="container">
         <h1>{feed_name} - デイリーレポート ({today_str})</h1>
         <p>合計 {len(entries)} 件の論文</p>
-"""
+"""]
 
     if not entries:
-        html_content += '<div class="no-entries">本日の新着論文はありませんでした。</div>'
+        html_parts.append('<div class="no-entries">本日の新着論文はありませんでした。</div>')
     else:
+        # Convert each unique formula across all entries only once
+        mathml_map = prebuild_mathml_map(entries)
         for entry in entries:
-            title = entry.get('title', 'No title')
             link = entry.get('link', '')
             summary = entry.get('summary', entry.get('description', ''))
             pub_date_str = entry.get('published', entry.get('updated', ''))
 
             # Convert LaTeX to MathML
-            summary_with_mathml = convert_latex_to_mathml(summary)
+            summary_with_mathml = convert_latex_to_mathml(summary, mathml_map)
 
             try:
                 pub_date = date_parser.parse(pub_date_str)
@@ -300,25 +476,24 @@ def generate_summary_html(feed_name, entries):
             except:
                 formatted_date = pub_date_str
 
-            html_content += f'''
-        <div class="entry">
-            <h2><a href="{link}" target="_blank">{title}</a></h2>
-            <div class="meta">公開日: {formatted_date}</div>
-            <div class="summary">{summary_with_mathml}</div>
-        </div>
-'''
+            html_parts.append(_SUMMARY_ENTRY_TEMPLATE.substitute(
+                title=title_html(entry),
+                link=escape(link, quote=True),
+                date=escape(formatted_date),
+                summary=summary_with_mathml,
+            ))
 
-    html_content += """
+    html_parts.append("""
     </div>
 </body>
 </html>
-"""
+""")
 
-    return html_content
+    return ''.join(html_parts)
 
 
-def send_summary_email(feed_name, entries, smtp_config):
-    """Send one summary email for all entries."""
+def send_summary_email(feed_name, entries, server, smtp_config):
+    """Send one summary email for all entries over an already-connected SMTP session."""
     today_str = datetime.now().strftime("%Y-%m-%d")
 
     # Generate HTML report
@@ -331,22 +506,22 @@ def send_summary_email(feed_name, entries, smtp_config):
     msg['To'] = smtp_config['to_email']
 
     # Text version
-    text_body = f"{feed_name} - デイリーレポート ({today_str})\n\n"
-    text_body += f"合計 {len(entries)} 件の論文\n\n"
+    text_parts = [
+        f"{feed_name} - デイリーレポート ({today_str})\n\n",
+        f"合計 {len(entries)} 件の論文\n\n",
+    ]
     for i, entry in enumerate(entries, 1):
         title = entry.get('title', 'No title')
         link = entry.get('link', '')
-        text_body += f"{i}. {title}\n   {link}\n\n"
+        text_parts.append(f"{i}. {title}\n   {link}\n\n")
+    text_body = ''.join(text_parts)
 
     msg.attach(MIMEText(text_body, 'plain', 'utf-8'))
     msg.attach(MIMEText(html_body, 'html', 'utf-8'))
 
     # Send email
     try:
-        with smtplib.SMTP(smtp_config['smtp_host'], smtp_config['smtp_port']) as server:
-            server.starttls()
-            server.login(smtp_config['smtp_user'], smtp_config['smtp_password'])
-            server.send_message(msg)
+        server.send_message(msg)
         print(f"  Summary email sent for {feed_name} ({len(entries)} entries)")
     except Exception as e:
         print(f"  Failed to send summary email: {e}")
@@ -388,53 +563,96 @@ def main():
 
     # Fetch online feeds
     if 'online' in config.get('feeds', {}):
-        for feed_name, feed_url in config['feeds']['online'].items():
-            print(f"Processing online feed: {feed_name}")
-            feed = fetch_online_feed(feed_url)
-            all_feeds[feed_name] = feed
-            print(f"  Found {len(feed.entries)} entries")
+        online_feeds = list(config['feeds']['online'].items())
+        if online_feeds:
+            names = [feed_name for feed_name, _ in online_feeds]
+            urls = [feed_url for _, feed_url in online_feeds]
+            with ThreadPoolExecutor(max_workers=min(16, len(urls))) as ex:
+                all_feeds.update(zip(names, ex.map(fetch_online_feed, urls)))
+            for feed_name in names:
+                print(f"Online feed {feed_name}: found {len(all_feeds[feed_name].entries)} entries")
 
     # Fetch local feeds
     if 'local' in config.get('feeds', {}):
-        for feed_name, script_path in config['feeds']['local'].items():
-            print(f"Processing local feed: {feed_name}")
-            feed = fetch_local_feed(script_path)
-            all_feeds[feed_name] = feed
-            print(f"  Found {len(feed.entries)} entries")
+        local_feeds = list(config['feeds']['local'].items())
+        if local_feeds:
+            names = [feed_name for feed_name, _ in local_feeds]
+            script_paths = [script_path for _, script_path in local_feeds]
+            with ThreadPoolExecutor(max_workers=min(16, len(script_paths))) as ex:
+                all_feeds.update(zip(names, ex.map(fetch_local_feed, script_paths)))
+            for feed_name in names:
+                print(f"Local feed {feed_name}: found {len(all_feeds[feed_name].entries)} entries")
+
+    # Fetch in-process local feeds
+    if 'local-inproc' in config.get('feeds', {}):
+        inproc_feeds = list(config['feeds']['local-inproc'].items())
+        if inproc_feeds:
+            names = [feed_name for feed_name, _ in inproc_feeds]
+            module_names = [module_name for _, module_name in inproc_feeds]
+            with ThreadPoolExecutor(max_workers=min(16, len(module_names))) as ex:
+                all_feeds.update(zip(names, ex.map(fetch_local_feed_inproc, module_names)))
+            for feed_name in names:
+                print(f"In-process feed {feed_name}: found {len(all_feeds[feed_name].entries)} entries")
 
     print()
 
-    # Process by-entry style feeds
-    if 'by-entry' in config.get('style', {}):
-        print("Processing by-entry style feeds...")
-        for feed_name in config['style']['by-entry']:
-            if feed_name not in all_feeds:
-                print(f"  Warning: Feed '{feed_name}' not found, skipping")
-                continue
+    # Filter each feed at most once, even if it appears in several styles
+    recent_by_feed = {}
 
+    def get_recent_entries(feed_name):
+        if feed_name not in recent_by_feed:
             feed = all_feeds[feed_name]
-            recent_entries = filter_recent_entries(feed.entries, days_back=1)
+            recent_by_feed[feed_name] = filter_recent_entries(feed.entries, days_back=1)
+        return recent_by_feed[feed_name]
 
-            print(f"  {feed_name}: {len(recent_entries)} recent entries")
-            for entry in recent_entries:
-                send_by_entry_email(feed_name, entry, smtp_config)
-        print()
+    # Share one SMTP session (one TLS handshake and login) across all emails,
+    # opened only once there is something to send
+    smtp_server = None
 
-    # Process Summary style feeds
-    if 'Summary' in config.get('style', {}):
-        print("Processing Summary style feeds...")
-        for feed_name in config['style']['Summary']:
-            if feed_name not in all_feeds:
-                print(f"  Warning: Feed '{feed_name}' not found, skipping")
-                continue
+    def get_smtp_server():
+        nonlocal smtp_server
+        if smtp_server is None:
+            smtp_server = open_smtp_connection(smtp_config)
+        return smtp_server
 
-            feed = all_feeds[feed_name]
-            recent_entries = filter_recent_entries(feed.entries, days_back=1)
-
-            print(f"  {feed_name}: {len(recent_entries)} recent entries")
-            if recent_entries:
-                send_summary_email(feed_name, recent_entries, smtp_config)
-        print()
+    try:
+        # Process by-entry style feeds
+        if 'by-entry' in config.get('style', {}):
+            print("Processing by-entry style feeds...")
+            for feed_name in config['style']['by-entry']:
+                if feed_name not in all_feeds:
+                    print(f"  Warning: Feed '{feed_name}' not found, skipping")
+                    continue
+
+                recent_entries = get_recent_entries(feed_name)
+
+                print(f"  {feed_name}: {len(recent_entries)} recent entries")
+                for entry in recent_entries:
+                    send_by_entry_email(feed_name, entry, get_smtp_server(), smtp_config)
+            print()
+
+        # Process Summary style feeds
+        if 'Summary' in config.get('style', {}):
+            print("Processing Summary style feeds...")
+            for feed_name in config['style']['Summary']:
+                if feed_name not in all_feeds:
+                    print(f"  Warning: Feed '{feed_name}' not found, skipping")
+                    continue
+
+                recent_entries = get_recent_entries(feed_name)
+
+                print(f"  {feed_name}: {len(recent_entries)} recent entries")
+                if recent_entries:
+                    send_summary_email(feed_name, recent_entries, get_smtp_server(), smtp_config)
+            print()
+    finally:
+        if smtp_server is not None:
+            try:
+                smtp_server.quit()
+            except smtplib.SMTPServerDisconnected:
+                pass
+            finally:
+                smtp_server.close()
 
     print("All feeds processed successfully!")
 
@@ -9,77 +9,136 @@ import re
 from feedgen.feed import FeedGenerator
 from loguru import logger
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-hit_threshold = 2
+# Prefer the linear-time RE2 engine (google-re2) for keyword scanning;
+# fall back to the standard library if it cannot be imported.
+try:
+    import re2 as keyword_re
+except ImportError:
+    keyword_re = re
 
-def create_filtered_feed(output_path: str) -> FeedGenerator:
-    """Create and populate a filtered RSS feed."""
-    fg = FeedGenerator()
-    fg.title("papers for Project IEFL")
-    fg.link(href='https://example.com/papers', rel='alternate')
-    fg.description("papers for Project IEFL")
+hit_threshold = 2
 
-    # Target feeds
-    FEEDS = [
-        # APS
-        'https://feeds.aps.org/rss/recent/pra.xml',
-        'https://feeds.aps.org/rss/recent/prd.xml',
-        'https://feeds.aps.org/rss/recent/prresearch.xml',
-        'https://feeds.aps.org/rss/recent/prl.xml',
-        'https://feeds.aps.org/rss/recent/prx.xml',
-        'https://feeds.aps.org/rss/recent/rmp.xml',
-        # arXiv category RSS (new submissions)
-        'https://rss.arxiv.org/rss/quant-ph',
-        'https://rss.arxiv.org/rss/hep-th',
-        'https://rss.arxiv.org/rss/math-ph'
-    ]
+# Target feeds
+FEEDS = [
+    # APS
+    'https://feeds.aps.org/rss/recent/pra.xml',
+    'https://feeds.aps.org/rss/recent/prd.xml',
+    'https://feeds.aps.org/rss/recent/prresearch.xml',
+    'https://feeds.aps.org/rss/recent/prl.xml',
+    'https://feeds.aps.org/rss/recent/prx.xml',
+    'https://feeds.aps.org/rss/recent/rmp.xml',
+    # arXiv category RSS (new submissions)
+    'https://rss.arxiv.org/rss/quant-ph',
+    'https://rss.arxiv.org/rss/hep-th',
+    'https://rss.arxiv.org/rss/math-ph'
+]
 
-    STRONG_WORDS = {
-        'modular Hamiltonian', r'entanglement hamiltonian',
-        r'measurement-induced', r'\bMIET\b',
-        r'\bQNEC\b', r'Bekenstein',
-        r'\bAQFT\b', 'Haag-(?:Araki-)Kastler',
-    }
-    WEAK_WORDS = {
-        r'\bmodular\b', r'\bentanglement\b',
-        r'relative entropy', r'\bmeasurement\b', r'\bCFT\b', r'quantum field theory',
-        r'free field', r'holographic',
-    }
-    STRONG_WORD_RE = re.compile('|'.join(STRONG_WORDS), re.I)
-    WEAK_WORD_RE = re.compile('|'.join(WEAK_WORDS), re.I)
+STRONG_WORDS = {
+    'modular Hamiltonian', r'entanglement hamiltonian',
+    r'measurement-induced', r'\bMIET\b',
+    r'\bQNEC\b', r'Bekenstein',
+    r'\bAQFT\b', 'Haag-(?:Araki-)Kastler',
+}
+WEAK_WORDS = {
+    r'\bmodular\b', r'\bentanglement\b',
+    r'relative entropy', r'\bmeasurement\b', r'\bCFT\b', r'quantum field theory',
+    r'free field', r'holographic',
+}
+# Single pattern with one named group per keyword: s<i> for strong, w<i> for weak.
+# Strong branches come first so they win when both match at the same position.
+# The inline (?i) flag is understood by both re and RE2.
+KEYWORD_RE = keyword_re.compile(
+    '(?i)' + '|'.join(
+        [f'(?P<s{i}>{p})' for i, p in enumerate(STRONG_WORDS)]
+        + [f'(?P<w{i}>{p})' for i, p in enumerate(WEAK_WORDS)]
+    )
+)
 
-    def wanted(text: str, hist_threshold=2) -> bool:
-        """Check if text contains relevant keywords."""
-        strong_hits = set(STRONG_WORD_RE.findall(text))
-        if len(strong_hits) > 0:
+def wanted(text: str, hist_threshold=hit_threshold) -> bool:
+    """Check if text contains relevant keywords."""
+    # One scan: stop at the first strong hit or once enough unique weak hits are seen
+    weak_hits = set()
+    for m in KEYWORD_RE.finditer(text):
+        if m.lastgroup.startswith('s'):
+            return True
+        weak_hits.add(m.lastgroup)
+        if len(weak_hits) >= hist_threshold:
             return True
-        weak_hits = set(WEAK_WORD_RE.findall(text))
-        return len(weak_hits) >= hist_threshold
+    return False
 
-    # Filter entries from all feeds
-    entry_count = 0
-    for url in FEEDS:
+def collect_entries() -> list:
+    """Fetch all target feeds and return the wanted entries as plain dicts.
+
+    Each dict has 'title', 'title_detail', 'link', 'published',
+    'published_parsed' and 'description' keys.
+    """
+    def fetch(url: str):
         logger.info(f"Processing feed: {url}")
         try:
-            feed = feedparser.parse(url)
+            return feedparser.parse(url, resolve_relative_uris=False)
+        except Exception as ex:
+            logger.error(f"Error fetching feed {url}: {ex}")
+            return None
+
+    # Fetch all feeds concurrently
+    with ThreadPoolExecutor(max_workers=min(16, len(FEEDS))) as ex:
+        feeds = list(ex.map(fetch, FEEDS))
+
+    # Filter entries from all feeds
+    entries = []
+    for url, feed in zip(FEEDS, feeds):
+        if feed is None:
+            continue
+        try:
             for e in feed.entries:
                 blob = f"{e.title} {e.summary}"
                 if wanted(blob):
-                    fe = fg.add_entry()
-                    fe.title(e.title)
-                    fe.link(href=e.link)
-                    fe.pubDate(e.published if 'published' in e else e.updated)
-                    fe.description(e.description)
-                    entry_count += 1
+                    entries.append({
+                        'title': e.title,
+                        'title_detail': e.get('title_detail', {}),
+                        'link': e.link,
+                        'published': e.published if 'published' in e else e.updated,
+                        'published_parsed': e.get('published_parsed') or e.get('updated_parsed'),
+                        'description': e.description,
+                    })
         except Exception as ex:
             logger.error(f"Error processing feed {url}: {ex}")
 
-    logger.info(f'Filtered feed created with {entry_count} entries')
-    fg.rss_file(output_path)
+    return entries
+
+def create_filtered_feed(output_path: str) -> FeedGenerator:
+    """Create and populate a filtered RSS feed.
+
+    If output_path is '-', the feed is written to stdout. A binary file
+    object may also be passed instead of a path.
+    """
+    fg = FeedGenerator()
+    fg.title("papers for Project IEFL")
+    fg.link(href='https://example.com/papers', rel='alternate')
+    fg.description("papers for Project IEFL")
+
+    # FeedGenerator is not thread-safe, so entries are added sequentially
+    entries = collect_entries()
+    for entry in entries:
+        fe = fg.add_entry()
+        fe.title(entry['title'])
+        fe.link(href=entry['link'])
+        fe.pubDate(entry['published'])
+        fe.description(entry['description'])
+
+    logger.info(f'Filtered feed created with {len(entries)} entries')
+    if output_path == '-':
+        sys.stdout.buffer.write(fg.rss_str())
+        sys.stdout.buffer.flush()
+    else:
+        fg.rss_file(output_path)
     return fg
 
 if __name__ == "__main__":
     output_file = sys.argv[1] if len(sys.argv) > 1 else 'filtered.xml'
-    Path(output_file).parent.mkdir(parents=True, exist_ok=True)
+    if output_file != '-':
+        Path(output_file).parent.mkdir(parents=True, exist_ok=True)
     create_filtered_feed(output_file)
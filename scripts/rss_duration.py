@@ -3,11 +3,51 @@
 APS RSS feed duration checker.
 Checks the time span of articles in APS RSS feeds and logs warnings if the span is too short.
 """
-import re
 import requests
+from lxml import etree
+import json
 import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from pathlib import Path
+
+DC_DATE_TAG = '{http://purl.org/dc/elements/1.1/}date'
+STATE_PATH = Path.home() / '.cache' / 'aps_reporter' / 'rss_duration_state.json'
+
+def discard_parsed(elem):
+    """Free an iterparse element together with everything parsed before it.
+
+    Removes the element's earlier siblings (the rest of its item so far) and
+    its parent's earlier siblings (previous items), so memory stays bounded
+    by the current item plus the parser's read-ahead, not the feed size.
+    """
+    elem.clear()
+    for node in (elem, elem.getparent()):
+        if node is None or node.getparent() is None:
+            continue
+        while node.getprevious() is not None:
+            del node.getparent()[0]
+
+def load_state(logger: logging.Logger) -> dict:
+    """Load the per-URL ETag / Last-Modified state and last scan results."""
+    if not STATE_PATH.exists():
+        return {}
+    try:
+        with open(STATE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        logger.debug(f"Could not read state file {STATE_PATH}: {e}")
+        return {}
+
+def save_state(state: dict, logger: logging.Logger):
+    """Save the per-URL ETag / Last-Modified state and last scan results."""
+    try:
+        STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(STATE_PATH, 'w', encoding='utf-8') as f:
+            json.dump(state, f, indent=2)
+    except Exception as e:
+        logger.debug(f"Could not write state file {STATE_PATH}: {e}")
 
 def setup_logger(log_level: str) -> logging.Logger:
     """Set up and configure logger."""
@@ -31,35 +71,71 @@ def check_rss_duration(logger: logging.Logger):
         "PRA": "https://feeds.aps.org/rss/recent/pra.xml",
     }
 
-    # dc:date extraction regex
-    pubdate_re = re.compile(r"<dc:date>(.*?)</dc:date>")
+    state = load_state(logger)
+
+    def scan_dates(name: str, url: str) -> dict:
+        """Stream the feed and return its dc:date count, earliest and latest dates.
+
+        Sends a conditional request and reuses the previous result on 304.
+        """
+        prev = state.get(url, {})
+        headers = {}
+        if prev.get('etag'):
+            headers['If-None-Match'] = prev['etag']
+        if prev.get('modified'):
+            headers['If-Modified-Since'] = prev['modified']
 
-    # Process each feed
-    for name, url in rss_feeds.items():
+        response = requests.get(url, headers=headers, stream=True, timeout=10)
+        if response.status_code == 304 and 'found' in prev:
+            logger.debug(f"{name}: Not modified, using previous result")
+            response.close()
+            return prev
+        response.raise_for_status()
+        response.raw.decode_content = True
+
+        found = 0
+        earliest, latest = None, None
+        for _, elem in etree.iterparse(response.raw, tag=DC_DATE_TAG):
+            found += 1
+            try:
+                dt = datetime.fromisoformat(elem.text.strip())
+            except Exception:
+                logger.debug(f"{name}: Failed to parse date string: {elem.text}")
+                continue
+            finally:
+                discard_parsed(elem)
+            earliest = dt if earliest is None or dt < earliest else earliest
+            latest = dt if latest is None or dt > latest else latest
+
+        return {
+            'etag': response.headers.get('ETag'),
+            'modified': response.headers.get('Last-Modified'),
+            'found': found,
+            'earliest': earliest.isoformat() if earliest else None,
+            'latest': latest.isoformat() if latest else None,
+        }
+
+    # Fetch and scan all feeds concurrently
+    with ThreadPoolExecutor(max_workers=min(16, len(rss_feeds))) as ex:
+        futures = {url: (name, ex.submit(scan_dates, name, url)) for name, url in rss_feeds.items()}
+
+    # Report each feed
+    for url, (name, future) in futures.items():
         try:
-            response = requests.get(url, timeout=10)
-            response.raise_for_status()
-            matches = pubdate_re.findall(response.text)
+            result = future.result()
+            state[url] = result
+            found = result['found']
 
-            if not matches:
+            if not found:
                 logger.warning(f"{name}: No <dc:date> entries found.")
                 continue
 
-            dates = []
-            for match in matches:
-                try:
-                    dt = datetime.strptime(match, "%Y-%m-%dT%H:%M:%S%z")
-                    dates.append(dt)
-                except Exception:
-                    logger.debug(f"{name}: Failed to parse date string: {match}")
-                    continue
-
-            if not dates:
+            if result['earliest'] is None:
                 logger.warning(f"{name}: No valid dates parsed.")
                 continue
 
-            earliest = min(dates)
-            latest = max(dates)
+            earliest = datetime.fromisoformat(result['earliest'])
+            latest = datetime.fromisoformat(result['latest'])
             span = latest - earliest
 
             log_fn = logger.debug
@@ -71,6 +147,8 @@ def check_rss_duration(logger: logging.Logger):
         except Exception as e:
             logger.error(f"{name}: Error fetching or parsing - {e}")
 
+    save_state(state, logger)
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="APS RSS feed checker")
     parser.add_argument(
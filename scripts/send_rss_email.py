@@ -6,9 +6,10 @@ Alternative to r2e (rss2email) using standard SMTP.
 import argparse
 import smtplib
 import feedparser
+from dateutil import parser as date_parser
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 import os
 from loguru import logger
@@ -44,22 +45,27 @@ def send_rss_email(
         logger.error(f"RSS file not found: {rss_file}")
         return
 
-    feed = feedparser.parse(rss_file)
+    feed = feedparser.parse(rss_file, resolve_relative_uris=False)
     logger.info(f"Parsed RSS feed: {feed.feed.get('title', 'Unknown')} ({len(feed.entries)} entries)")
 
     # Filter recent entries
-    cutoff_date = datetime.now() - timedelta(days=days_back)
+    # Compare everything as naive UTC
+    cutoff_date = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=days_back)
     recent_entries = []
 
     for entry in feed.entries:
         pub_date_str = entry.get('published', entry.get('updated', ''))
         try:
-            # Try to parse the date
-            from dateutil import parser as date_parser
-            pub_date = date_parser.parse(pub_date_str)
-            # Make timezone-naive for comparison
-            if pub_date.tzinfo:
-                pub_date = pub_date.replace(tzinfo=None)
+            # Prefer the struct_time feedparser already parsed (UTC)
+            pub_parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+            if pub_parsed:
+                pub_date = datetime(*pub_parsed[:6])
+            else:
+                # Try to parse the date
+                pub_date = date_parser.parse(pub_date_str)
+                # Convert to naive UTC for comparison
+                if pub_date.tzinfo:
+                    pub_date = pub_date.astimezone(timezone.utc).replace(tzinfo=None)
 
             if pub_date >= cutoff_date:
                 recent_entries.append(entry)